@@ -46,8 +46,9 @@ done
 # Compute statistics with R.
 
 Rscript - << EOF
-claxon  <- read.table('/tmp/bench_times_claxon.dat')[[1]]
-libflac <- read.table('/tmp/bench_times_libflac.dat')[[1]]
+# Fail loudly on a malformed line, rather than silently reading a factor.
+claxon  <- read.table('/tmp/bench_times_claxon.dat', colClasses = 'numeric')[[1]]
+libflac <- read.table('/tmp/bench_times_libflac.dat', colClasses = 'numeric')[[1]]
 
 # Estimates the absolute error in (a ± aErr) / (b ± bErr).
 # See also https://en.wikipedia.org/wiki/Propagation_of_uncertainty.
@@ -9,8 +9,10 @@
 #  ./stats.r baseline.dat new.dat
 #  ./stats.r baseline.dat new.dat
 
-prev <- read.table(commandArgs(trailingOnly = TRUE)[1])
-data <- read.table(commandArgs(trailingOnly = TRUE)[2])
+# All columns are numeric. Saying so makes read.table fail loudly on a
+# malformed line, rather than silently reading a factor column.
+prev <- read.table(commandArgs(trailingOnly = TRUE)[1], colClasses = 'numeric')
+data <- read.table(commandArgs(trailingOnly = TRUE)[2], colClasses = 'numeric')
 
 # Note: `sapply` is like `Map` with arguments reversed,
 # but it also produces a different data structure as a